@@ -11,10 +11,10 @@ Usage:
 """
 
 import argparse
-import os
 import sys
 import yaml
 import re
+import time
 from pathlib import Path
 
 class DockerfileBuilder:
@@ -103,12 +103,13 @@ class DockerfileBuilder:
     def _build_dockerfile_content(self, platforms):
         """Build complete Dockerfile content."""
         lines = []
+        platform_list = ', '.join(f"{p['name']}:{p['version']}" for p in platforms)
         
         # Header
         lines.extend([
             "# Generated Multi-Platform Dockerfile",
-            f"# Platforms: {', '.join([f'{p['name']}:{p['version']}' for p in platforms])}",
-            f"# Generated at: {os.popen('date').read().strip()}",
+            f"# Platforms: {platform_list}",
+            f"# Generated at: {time.strftime('%a %b %e %H:%M:%S %Z %Y')}",
             "",
             "ARG BASE_IMAGE=ubuntu:22.04",
             "FROM ${BASE_IMAGE} as base",
@@ -257,7 +258,7 @@ class DockerfileBuilder:
         lines.extend([
             "",
             "# Install Claude Code CLI if Node.js is available",
-            "RUN if command -v npm >/dev/null 2>&1; then npm install -g @anthropic-ai/claude-code; fi",
+            "RUN if command -v npm >/dev/null 2>&1; then npm install -g --no-audit --no-fund --loglevel=error @anthropic-ai/claude-code; fi",
             "",
             "# Install Python packages for bot automation", 
             "RUN pip3 install --no-cache-dir --break-system-packages \\",
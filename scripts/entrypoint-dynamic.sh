@@ -79,7 +79,9 @@ except:
     fi
     
     # .NET detection
-    if find . -name "*.csproj" -o -name "*.sln" -o -name "*.fsproj" | head -1 | grep -q .; then
+    # Skip dependency/build trees and stop at the first match
+    if find . \( -name node_modules -o -name .git -o -name bin -o -name obj \) -prune \
+        -o \( -name "*.csproj" -o -name "*.sln" -o -name "*.fsproj" \) -print -quit | grep -q .; then
         local dotnet_version="8.0"
         
         # Try to detect version from project files
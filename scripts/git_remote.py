@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Git remote helpers shared by the bot scripts
+"""
+
+import configparser
+from pathlib import Path
+
+
+def read_origin_url(repo_dir):
+    """Read remote.origin.url from <repo_dir>/.git/config without spawning git.
+
+    Returns None when the file is missing, unreadable or has no origin
+    (e.g. worktrees where .git is a file), or when the value uses quoting
+    or inline comments that git would strip, so callers can fall back to
+    `git config --get remote.origin.url`.
+    """
+    parser = configparser.ConfigParser(strict=False, interpolation=None, allow_no_value=True)
+    try:
+        parser.read(Path(repo_dir) / ".git" / "config", encoding="utf-8")
+        url = parser.get('remote "origin"', 'url', fallback=None)
+    except (configparser.Error, UnicodeDecodeError):
+        return None
+    
+    # configparser returns the raw value; leave git's quoting/comment rules to git
+    if url is None or any(c in url for c in '";#'):
+        return None
+    return url
@@ -12,6 +12,8 @@ import argparse
 from datetime import datetime
 from pathlib import Path
 
+from git_remote import read_origin_url
+
 class GitHubTaskExecutor:
     def __init__(self, workspace_dir="/workspace", data_dir="/bot/data", repo=None):
         self.workspace_dir = workspace_dir
@@ -34,19 +36,22 @@ class GitHubTaskExecutor:
     def get_repo_from_git(self):
         """Get repository name from git remote"""
         try:
-            result = subprocess.run(
-                ["git", "config", "--get", "remote.origin.url"],
-                capture_output=True,
-                text=True,
-                cwd=self.workspace_dir
-            )
-            if result.returncode == 0:
+            url = read_origin_url(self.workspace_dir)
+            if url is None:
+                result = subprocess.run(
+                    ["git", "config", "--get", "remote.origin.url"],
+                    capture_output=True,
+                    text=True,
+                    cwd=self.workspace_dir
+                )
+                if result.returncode != 0:
+                    return None
                 url = result.stdout.strip()
-                # Extract owner/repo from various URL formats
-                if "github.com" in url:
-                    parts = url.split("/")[-2:]
-                    repo_name = parts[1].replace(".git", "")
-                    return f"{parts[0]}/{repo_name}"
+            # Extract owner/repo from various URL formats
+            if "github.com" in url:
+                parts = url.split("/")[-2:]
+                repo_name = parts[1].replace(".git", "")
+                return f"{parts[0]}/{repo_name}"
             return None
         except Exception as e:
             print(f"Error getting repo: {e}")
@@ -83,10 +88,11 @@ class GitHubTaskExecutor:
         try:
             issues = json.loads(output)
             # Filter out issues that are already completed or failed
+            finished_labels = frozenset((self.status_labels['completed'], self.status_labels['failed']))
             active_issues = []
             for issue in issues:
-                labels = [label['name'] for label in issue.get('labels', [])]
-                if not any(status in labels for status in [self.status_labels['completed'], self.status_labels['failed']]):
+                labels = {label['name'] for label in issue.get('labels', [])}
+                if finished_labels.isdisjoint(labels):
                     active_issues.append(issue)
             return active_issues
         except json.JSONDecodeError:
@@ -94,43 +94,49 @@ def check_bot_activity(data_dir="/bot/data"):
 
 def display_status(status):
     """Display bot status in a formatted way"""
-    clear_screen()
+    lines = []
     
-    print("=" * 80)
-    print(f"🤖 CLAUDE BOT ACTIVITY MONITOR - {status['timestamp']}")
-    print("=" * 80)
+    lines.append("=" * 80)
+    lines.append(f"🤖 CLAUDE BOT ACTIVITY MONITOR - {status['timestamp']}")
+    lines.append("=" * 80)
     
     # Summary
-    print(f"\n📊 SUMMARY:")
-    print(f"   Queued Tasks: {status['queued_tasks']}")
-    print(f"   Processed Tasks: {status['processed_tasks']}")
+    lines.append(f"\n📊 SUMMARY:")
+    lines.append(f"   Queued Tasks: {status['queued_tasks']}")
+    lines.append(f"   Processed Tasks: {status['processed_tasks']}")
     
     # Queue status
     if status["queue_items"]:
-        print(f"\n📋 CURRENT QUEUE:")
+        lines.append(f"\n📋 CURRENT QUEUE:")
         for item in status["queue_items"]:
-            priority_icon = "🔴" if item["priority"] == "high" else "🟡" if item["priority"] == "medium" else "🟢"
-            print(f"   {priority_icon} {item['title'][:60]}")
-            print(f"      Created: {item['created']}")
+            priority = item["priority"]
+            priority_icon = "🔴" if priority == "high" else "🟡" if priority == "medium" else "🟢"
+            lines.append(f"   {priority_icon} {item['title'][:60]}")
+            lines.append(f"      Created: {item['created']}")
     else:
-        print(f"\n📋 QUEUE: Empty")
+        lines.append(f"\n📋 QUEUE: Empty")
     
     # Recent activity
     if status["recent_activity"]:
-        print(f"\n🕒 RECENT ACTIVITY:")
+        lines.append(f"\n🕒 RECENT ACTIVITY:")
         for activity in status["recent_activity"]:
-            status_icon = "✅" if activity["status"] == "completed" else "❌" if activity["status"] == "failed" else "⏳"
-            print(f"   {status_icon} {activity['title'][:60]}")
-            print(f"      Completed: {activity['completed']}")
+            activity_status = activity["status"]
+            status_icon = "✅" if activity_status == "completed" else "❌" if activity_status == "failed" else "⏳"
+            lines.append(f"   {status_icon} {activity['title'][:60]}")
+            lines.append(f"      Completed: {activity['completed']}")
     
     # Container logs
-    print(f"\n📝 RECENT LOGS:")
+    lines.append(f"\n📝 RECENT LOGS:")
     for log_line in status["container_logs"][-8:]:
         if log_line.strip():
-            print(f"   {log_line}")
+            lines.append(f"   {log_line}")
+    
+    lines.append(f"\n{'=' * 80}")
+    lines.append("Press Ctrl+C to exit | Refreshing every 10 seconds...")
     
-    print(f"\n{'=' * 80}")
-    print("Press Ctrl+C to exit | Refreshing every 10 seconds...")
+    # Build the whole frame before clearing so the screen redraws in one write
+    clear_screen()
+    print("\n".join(lines))
 
 def monitor_loop(data_dir="/bot/data", refresh_interval=10):
     """Main monitoring loop"""
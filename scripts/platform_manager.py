@@ -17,11 +17,28 @@ import os
 import re
 import sys
 import xml.etree.ElementTree as ET
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
 import yaml
 import subprocess
 
+# Use the libyaml-backed dumper when PyYAML was built with it
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Version extraction patterns, compiled once at import
+MAJOR_MINOR_PATCH_RE = re.compile(r'(\d+\.\d+\.\d+)')
+MAJOR_MINOR_RE = re.compile(r'(\d+\.\d+)')
+DOTNET_FRAMEWORK_RE = re.compile(r'net(\d+\.\d+)')
+GRADLE_SOURCE_COMPAT_RE = re.compile(r'sourceCompatibility\s*=\s*["\']?([\d.]+)["\']?')
+GRADLE_JAVA_VERSION_RE = re.compile(r'JavaVersion\.VERSION_(\d+)')
+RUNTIME_TXT_PYTHON_RE = re.compile(r'python-(\d+\.\d+)')
+PYPROJECT_REQUIRES_PYTHON_RE = re.compile(r'requires-python\s*=\s*["\']([^"\']+)["\']')
+GO_MOD_VERSION_RE = re.compile(r'^go\s+(\d+\.\d+)', re.MULTILINE)
+RUST_CHANNEL_RE = re.compile(r'channel\s*=\s*["\']([^"\']+)["\']')
+CARGO_RUST_VERSION_RE = re.compile(r'rust-version\s*=\s*["\']([^"\']+)["\']')
+GEMFILE_RUBY_RE = re.compile(r'ruby\s+["\']([^"\']+)["\']')
+
 class PlatformManager:
     """Manages platform detection, validation, and configuration."""
     
@@ -59,77 +76,105 @@ class PlatformManager:
             
         print(f"🔍 Scanning {workspace_path} for platforms...")
         
+        # Snapshot the workspace root names once; every detector answers its
+        # existence and extension checks from this instead of stat()/glob().
+        # Dangling symlinks are dropped so membership matches Path.exists().
+        with os.scandir(workspace) as entries:
+            names = frozenset(
+                entry.name for entry in entries
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            )
+        detected = self._run_detectors(workspace, names)
+        
+        self.detected_platforms = detected
+        return detected
+        
+    def _run_detectors(self, workspace: Path, names: FrozenSet[str]) -> Dict[str, str]:
+        """Run every platform detector against the workspace."""
+        detected = {}
+        
         # Node.js detection
-        nodejs_version = self._detect_nodejs(workspace)
+        nodejs_version = self._detect_nodejs(workspace, names)
         if nodejs_version:
             detected['nodejs'] = nodejs_version
             print(f"  📦 Node.js {nodejs_version}")
             
         # .NET detection
-        dotnet_version = self._detect_dotnet(workspace)
+        dotnet_version = self._detect_dotnet(workspace, names)
         if dotnet_version:
             detected['dotnet'] = dotnet_version
             print(f"  🔷 .NET {dotnet_version}")
             
         # Java detection
-        java_version = self._detect_java(workspace)
+        java_version = self._detect_java(workspace, names)
         if java_version:
             detected['java'] = java_version
             print(f"  ☕ Java {java_version}")
             
         # Python detection
-        python_version = self._detect_python(workspace)
+        python_version = self._detect_python(workspace, names)
         if python_version:
             detected['python'] = python_version
             print(f"  🐍 Python {python_version}")
             
         # Go detection
-        go_version = self._detect_go(workspace)
+        go_version = self._detect_go(workspace, names)
         if go_version:
             detected['golang'] = go_version
             print(f"  🔵 Go {go_version}")
             
         # Rust detection
-        rust_version = self._detect_rust(workspace)
+        rust_version = self._detect_rust(workspace, names)
         if rust_version:
             detected['rust'] = rust_version
             print(f"  🦀 Rust {rust_version}")
             
         # PHP detection
-        php_version = self._detect_php(workspace)
+        php_version = self._detect_php(workspace, names)
         if php_version:
             detected['php'] = php_version
             print(f"  🐘 PHP {php_version}")
             
         # Ruby detection
-        ruby_version = self._detect_ruby(workspace)
+        ruby_version = self._detect_ruby(workspace, names)
         if ruby_version:
             detected['ruby'] = ruby_version
             print(f"  💎 Ruby {ruby_version}")
             
-        self.detected_platforms = detected
         return detected
         
-    def _detect_nodejs(self, workspace: Path) -> Optional[str]:
+    def _exists(self, workspace: Path, name: str, names: Optional[FrozenSet[str]] = None) -> bool:
+        """Check for a top-level workspace entry, using the scanned names if given."""
+        if names is not None:
+            return name in names
+        return (workspace / name).exists()
+        
+    def _glob_suffix(self, workspace: Path, suffix: str, names: Optional[FrozenSet[str]] = None) -> List[Path]:
+        """List top-level workspace entries ending in suffix, using the scanned names if given."""
+        if names is not None:
+            return sorted(workspace / name for name in names if name.endswith(suffix))
+        return list(workspace.glob(f'*{suffix}'))
+        
+    def _detect_nodejs(self, workspace: Path, names: Optional[FrozenSet[str]] = None) -> Optional[str]:
         """Detect Node.js version from project files."""
         # Check for Node.js indicators
         indicators = ['package.json', 'yarn.lock', 'pnpm-lock.yaml', '.nvmrc', 'node_modules']
-        if not any((workspace / indicator).exists() for indicator in indicators):
+        if not any(self._exists(workspace, indicator, names) for indicator in indicators):
             return None
             
         # Try to get version from .nvmrc
         nvmrc = workspace / '.nvmrc'
-        if nvmrc.exists():
+        if self._exists(workspace, '.nvmrc', names):
             try:
                 version = nvmrc.read_text().strip()
-                if re.match(r'\\d+\\.\\d+(\\.\\d+)?', version):
+                if MAJOR_MINOR_RE.match(version):
                     return version
             except Exception:
                 pass
                 
         # Try to get version from package.json engines
         package_json = workspace / 'package.json'
-        if package_json.exists():
+        if self._exists(workspace, 'package.json', names):
             try:
                 with open(package_json) as f:
                     data = json.load(f)
@@ -138,12 +183,12 @@ class PlatformManager:
                 node_version = engines.get('node', '')
                 
                 # Extract version number from requirement
-                match = re.search(r'(\d+\.\d+\.\d+)', node_version)
+                match = MAJOR_MINOR_PATCH_RE.search(node_version)
                 if match:
                     return match.group(1)
                     
                 # Extract major.minor from requirement
-                match = re.search(r'(\d+\.\d+)', node_version)
+                match = MAJOR_MINOR_RE.search(node_version)
                 if match:
                     major_minor = match.group(1)
                     # Find best patch version from our supported versions
@@ -157,19 +202,19 @@ class PlatformManager:
         # Default to LTS version
         return self.config['platforms'].get('nodejs', {}).get('default_version', '18.16.0')
         
-    def _detect_dotnet(self, workspace: Path) -> Optional[str]:
+    def _detect_dotnet(self, workspace: Path, names: Optional[FrozenSet[str]] = None) -> Optional[str]:
         """Detect .NET version from project files."""
         # Check for .NET indicators
-        csproj_files = list(workspace.glob('*.csproj'))
-        sln_files = list(workspace.glob('*.sln'))
-        fsproj_files = list(workspace.glob('*.fsproj'))
+        csproj_files = self._glob_suffix(workspace, '.csproj', names)
+        sln_files = self._glob_suffix(workspace, '.sln', names)
+        fsproj_files = self._glob_suffix(workspace, '.fsproj', names)
         
-        if not (csproj_files or sln_files or fsproj_files or (workspace / 'global.json').exists()):
+        if not (csproj_files or sln_files or fsproj_files or self._exists(workspace, 'global.json', names)):
             return None
             
         # Try to get version from global.json
         global_json = workspace / 'global.json'
-        if global_json.exists():
+        if self._exists(workspace, 'global.json', names):
             try:
                 with open(global_json) as f:
                     data = json.load(f)
@@ -204,7 +249,7 @@ class PlatformManager:
                     framework = elem.text
                     if framework:
                         # Extract version from framework like "net8.0"
-                        match = re.search(r'net(\d+\.\d+)', framework)
+                        match = DOTNET_FRAMEWORK_RE.search(framework)
                         if match:
                             return match.group(1)
                             
@@ -212,20 +257,20 @@ class PlatformManager:
             pass
         return None
         
-    def _detect_java(self, workspace: Path) -> Optional[str]:
+    def _detect_java(self, workspace: Path, names: Optional[FrozenSet[str]] = None) -> Optional[str]:
         """Detect Java version from project files."""
         # Check for Java indicators
         if not any([
-            (workspace / 'pom.xml').exists(),
-            (workspace / 'build.gradle').exists(),
-            (workspace / 'build.gradle.kts').exists(),
-            list(workspace.glob('*.java'))
+            self._exists(workspace, 'pom.xml', names),
+            self._exists(workspace, 'build.gradle', names),
+            self._exists(workspace, 'build.gradle.kts', names),
+            self._glob_suffix(workspace, '.java', names)
         ]):
             return None
             
         # Try Maven pom.xml
         pom_xml = workspace / 'pom.xml'
-        if pom_xml.exists():
+        if self._exists(workspace, 'pom.xml', names):
             version = self._parse_maven_java_version(pom_xml)
             if version:
                 return version
@@ -233,7 +278,7 @@ class PlatformManager:
         # Try Gradle build files
         for gradle_file in ['build.gradle', 'build.gradle.kts']:
             gradle_path = workspace / gradle_file
-            if gradle_path.exists():
+            if self._exists(workspace, gradle_file, names):
                 version = self._parse_gradle_java_version(gradle_path)
                 if version:
                     return version
@@ -268,12 +313,12 @@ class PlatformManager:
             content = gradle_path.read_text()
             
             # Look for sourceCompatibility
-            match = re.search(r'sourceCompatibility\s*=\s*["\']?([\d.]+)["\']?', content)
+            match = GRADLE_SOURCE_COMPAT_RE.search(content)
             if match:
                 return match.group(1)
                 
             # Look for JavaVersion
-            match = re.search(r'JavaVersion\.VERSION_(\d+)', content)
+            match = GRADLE_JAVA_VERSION_RE.search(content)
             if match:
                 return match.group(1)
                 
@@ -281,32 +326,32 @@ class PlatformManager:
             pass
         return None
         
-    def _detect_python(self, workspace: Path) -> Optional[str]:
+    def _detect_python(self, workspace: Path, names: Optional[FrozenSet[str]] = None) -> Optional[str]:
         """Detect Python version from project files."""
         # Check for Python indicators
         if not any([
-            (workspace / 'requirements.txt').exists(),
-            (workspace / 'pyproject.toml').exists(),
-            (workspace / 'setup.py').exists(),
-            (workspace / 'Pipfile').exists(),
-            (workspace / 'poetry.lock').exists(),
-            list(workspace.glob('*.py'))
+            self._exists(workspace, 'requirements.txt', names),
+            self._exists(workspace, 'pyproject.toml', names),
+            self._exists(workspace, 'setup.py', names),
+            self._exists(workspace, 'Pipfile', names),
+            self._exists(workspace, 'poetry.lock', names),
+            self._glob_suffix(workspace, '.py', names)
         ]):
             return None
             
         # Try pyproject.toml
         pyproject = workspace / 'pyproject.toml'
-        if pyproject.exists():
+        if self._exists(workspace, 'pyproject.toml', names):
             version = self._parse_python_pyproject_version(pyproject)
             if version:
                 return version
                 
         # Try runtime.txt (Heroku-style)
         runtime_txt = workspace / 'runtime.txt'
-        if runtime_txt.exists():
+        if self._exists(workspace, 'runtime.txt', names):
             try:
                 content = runtime_txt.read_text().strip()
-                match = re.search(r'python-(\d+\.\d+)', content)
+                match = RUNTIME_TXT_PYTHON_RE.search(content)
                 if match:
                     return match.group(1)
             except Exception:
@@ -333,7 +378,7 @@ class PlatformManager:
             requires_python = data.get('project', {}).get('requires-python', '')
             if requires_python:
                 # Extract version from requirement like ">=3.8"
-                match = re.search(r'(\d+\.\d+)', requires_python)
+                match = MAJOR_MINOR_RE.search(requires_python)
                 if match:
                     return match.group(1)
                     
@@ -345,26 +390,26 @@ class PlatformManager:
         """Parse Python version from pyproject.toml using regex."""
         try:
             content = pyproject_path.read_text()
-            match = re.search(r'requires-python\s*=\s*["\']([^"\']+)["\']', content)
+            match = PYPROJECT_REQUIRES_PYTHON_RE.search(content)
             if match:
                 version_spec = match.group(1)
-                version_match = re.search(r'(\d+\.\d+)', version_spec)
+                version_match = MAJOR_MINOR_RE.search(version_spec)
                 if version_match:
                     return version_match.group(1)
         except Exception:
             pass
         return None
         
-    def _detect_go(self, workspace: Path) -> Optional[str]:
+    def _detect_go(self, workspace: Path, names: Optional[FrozenSet[str]] = None) -> Optional[str]:
         """Detect Go version from project files."""
         go_mod = workspace / 'go.mod'
-        if not go_mod.exists() and not list(workspace.glob('*.go')):
+        if not self._exists(workspace, 'go.mod', names) and not self._glob_suffix(workspace, '.go', names):
             return None
             
-        if go_mod.exists():
+        if self._exists(workspace, 'go.mod', names):
             try:
                 content = go_mod.read_text()
-                match = re.search(r'^go\s+(\d+\.\d+)', content, re.MULTILINE)
+                match = GO_MOD_VERSION_RE.search(content)
                 if match:
                     return match.group(1)
             except Exception:
@@ -373,21 +418,21 @@ class PlatformManager:
         # Default to stable version
         return self.config['platforms'].get('golang', {}).get('default_version', '1.21')
         
-    def _detect_rust(self, workspace: Path) -> Optional[str]:
+    def _detect_rust(self, workspace: Path, names: Optional[FrozenSet[str]] = None) -> Optional[str]:
         """Detect Rust version from project files."""
-        if not ((workspace / 'Cargo.toml').exists() or list(workspace.glob('*.rs'))):
+        if not (self._exists(workspace, 'Cargo.toml', names) or self._glob_suffix(workspace, '.rs', names)):
             return None
             
         # Try rust-toolchain.toml
         rust_toolchain = workspace / 'rust-toolchain.toml'
-        if rust_toolchain.exists():
+        if self._exists(workspace, 'rust-toolchain.toml', names):
             version = self._parse_rust_toolchain_version(rust_toolchain)
             if version:
                 return version
                 
         # Try Cargo.toml
         cargo_toml = workspace / 'Cargo.toml'
-        if cargo_toml.exists():
+        if self._exists(workspace, 'Cargo.toml', names):
             version = self._parse_cargo_rust_version(cargo_toml)
             if version:
                 return version
@@ -399,10 +444,10 @@ class PlatformManager:
         """Parse Rust version from rust-toolchain.toml."""
         try:
             content = toolchain_path.read_text()
-            match = re.search(r'channel\s*=\s*["\']([^"\']+)["\']', content)
+            match = RUST_CHANNEL_RE.search(content)
             if match:
                 channel = match.group(1)
-                version_match = re.search(r'(\d+\.\d+)', channel)
+                version_match = MAJOR_MINOR_RE.search(channel)
                 if version_match:
                     return version_match.group(1)
         except Exception:
@@ -413,23 +458,23 @@ class PlatformManager:
         """Parse Rust version from Cargo.toml."""
         try:
             content = cargo_path.read_text()
-            match = re.search(r'rust-version\s*=\s*["\']([^"\']+)["\']', content)
+            match = CARGO_RUST_VERSION_RE.search(content)
             if match:
                 version = match.group(1)
-                version_match = re.search(r'(\d+\.\d+)', version)
+                version_match = MAJOR_MINOR_RE.search(version)
                 if version_match:
                     return version_match.group(1)
         except Exception:
             pass
         return None
         
-    def _detect_php(self, workspace: Path) -> Optional[str]:
+    def _detect_php(self, workspace: Path, names: Optional[FrozenSet[str]] = None) -> Optional[str]:
         """Detect PHP version from project files."""
-        if not ((workspace / 'composer.json').exists() or list(workspace.glob('*.php'))):
+        if not (self._exists(workspace, 'composer.json', names) or self._glob_suffix(workspace, '.php', names)):
             return None
             
         composer_json = workspace / 'composer.json'
-        if composer_json.exists():
+        if self._exists(workspace, 'composer.json', names):
             try:
                 with open(composer_json) as f:
                     data = json.load(f)
@@ -438,7 +483,7 @@ class PlatformManager:
                 php_req = require.get('php', '')
                 
                 # Extract version from requirement like "^8.1"
-                match = re.search(r'(\d+\.\d+)', php_req)
+                match = MAJOR_MINOR_RE.search(php_req)
                 if match:
                     return match.group(1)
                     
@@ -448,34 +493,34 @@ class PlatformManager:
         # Default to stable version
         return self.config['platforms'].get('php', {}).get('default_version', '8.2')
         
-    def _detect_ruby(self, workspace: Path) -> Optional[str]:
+    def _detect_ruby(self, workspace: Path, names: Optional[FrozenSet[str]] = None) -> Optional[str]:
         """Detect Ruby version from project files."""
         if not any([
-            (workspace / 'Gemfile').exists(),
-            (workspace / '.ruby-version').exists(),
-            list(workspace.glob('*.rb'))
+            self._exists(workspace, 'Gemfile', names),
+            self._exists(workspace, '.ruby-version', names),
+            self._glob_suffix(workspace, '.rb', names)
         ]):
             return None
             
         # Try .ruby-version
         ruby_version_file = workspace / '.ruby-version'
-        if ruby_version_file.exists():
+        if self._exists(workspace, '.ruby-version', names):
             try:
                 version = ruby_version_file.read_text().strip()
-                if re.match(r'\d+\.\d+', version):
+                if MAJOR_MINOR_RE.match(version):
                     return version
             except Exception:
                 pass
                 
         # Try Gemfile
         gemfile = workspace / 'Gemfile'
-        if gemfile.exists():
+        if self._exists(workspace, 'Gemfile', names):
             try:
                 content = gemfile.read_text()
-                match = re.search(r'ruby\s+["\']([^"\']+)["\']', content)
+                match = GEMFILE_RUBY_RE.search(content)
                 if match:
                     version = match.group(1)
-                    version_match = re.search(r'(\d+\.\d+)', version)
+                    version_match = MAJOR_MINOR_RE.search(version)
                     if version_match:
                         return version_match.group(1)
             except Exception:
@@ -580,7 +625,7 @@ class PlatformManager:
             output_path = f"platforms.detected.yml"
             
         with open(output_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
             
         print(f"Generated platform config: {output_path}")
         return output_path
@@ -596,7 +641,6 @@ class PlatformManager:
         
     def _get_current_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime
         return datetime.now().isoformat()
 
 
@@ -637,8 +681,9 @@ def main():
         if args.command == 'detect':
             detected = manager.detect_platforms(args.workspace)
             if detected:
-                print(f"\\n🎯 Detected platforms: {manager._format_platforms_string(detected)}")
-                print(f"\\n💡 To use: ENABLED_PLATFORMS='{manager._format_platforms_string(detected)}' docker-compose --profile dynamic up -d")
+                platforms_string = manager._format_platforms_string(detected)
+                print(f"\n🎯 Detected platforms: {platforms_string}")
+                print(f"\n💡 To use: ENABLED_PLATFORMS='{platforms_string}' docker-compose --profile dynamic up -d")
             else:
                 print("No platforms detected")
                 return 1
@@ -11,6 +11,8 @@ import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from git_remote import read_origin_url
+
 class PRFeedbackHandler:
     def __init__(self, workspace_dir="/workspace", data_dir="/.bot/data", repo=None):
         self.workspace_dir = workspace_dir
@@ -41,18 +43,21 @@ class PRFeedbackHandler:
     def get_repo_from_git(self):
         """Get repository name from git remote"""
         try:
-            result = subprocess.run(
-                ["git", "config", "--get", "remote.origin.url"],
-                capture_output=True,
-                text=True,
-                cwd=self.workspace_dir
-            )
-            if result.returncode == 0:
+            url = read_origin_url(self.workspace_dir)
+            if url is None:
+                result = subprocess.run(
+                    ["git", "config", "--get", "remote.origin.url"],
+                    capture_output=True,
+                    text=True,
+                    cwd=self.workspace_dir
+                )
+                if result.returncode != 0:
+                    return None
                 url = result.stdout.strip()
-                if "github.com" in url:
-                    parts = url.split("/")[-2:]
-                    repo_name = parts[1].replace(".git", "")
-                    return f"{parts[0]}/{repo_name}"
+            if "github.com" in url:
+                parts = url.split("/")[-2:]
+                repo_name = parts[1].replace(".git", "")
+                return f"{parts[0]}/{repo_name}"
             return None
         except Exception as e:
             print(f"Error getting repo: {e}")
@@ -14,7 +14,10 @@ Supports multiple secret backends:
 import os
 import sys
 import json
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
 import logging
@@ -22,6 +25,27 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+REQUIRED_SECRETS = ('GITHUB_TOKEN', 'ANTHROPIC_API_KEY')
+_REQUIRED_SECRET_SET = frozenset(REQUIRED_SECRETS)
+
+# Docker secret file name -> environment variable name
+DOCKER_SECRET_FILES = {
+    'github_token': 'GITHUB_TOKEN',
+    'anthropic_api_key': 'ANTHROPIC_API_KEY',
+}
+
+# Shared across loaders so the credential chain and its token cache are built once
+_azure_credential = None
+
+
+def _get_azure_credential():
+    """Return the process-wide DefaultAzureCredential, creating it on first use."""
+    global _azure_credential
+    if _azure_credential is None:
+        from azure.identity import DefaultAzureCredential
+        _azure_credential = DefaultAzureCredential()
+    return _azure_credential
+
 
 class SecretsLoader:
     """Load secrets from various secure backends."""
@@ -42,10 +66,7 @@ class SecretsLoader:
             self.load_from_env_vars,
         ]
         
-        required_secrets = {
-            'GITHUB_TOKEN': None,
-            'ANTHROPIC_API_KEY': None,
-        }
+        required_secrets = dict.fromkeys(REQUIRED_SECRETS)
         
         for loader in loaders:
             try:
@@ -53,30 +74,27 @@ class SecretsLoader:
                 for key, value in found_secrets.items():
                     if key in required_secrets and required_secrets[key] is None:
                         required_secrets[key] = value
-                        logger.info(f"✓ Loaded {key} from {loader.__name__}")
+                        logger.info("✓ Loaded %s from %s", key, loader.__name__)
                         
                 # Check if all required secrets are found
                 if all(v is not None for v in required_secrets.values()):
                     logger.info("✅ All required secrets loaded successfully")
                     return required_secrets
             except Exception as e:
-                logger.debug(f"Loader {loader.__name__} failed: {e}")
+                logger.debug("Loader %s failed: %s", loader.__name__, e)
                 continue
                 
         # Check what's missing
         missing = [k for k, v in required_secrets.items() if v is None]
         if missing:
-            logger.error(f"❌ Missing required secrets: {', '.join(missing)}")
+            logger.error("❌ Missing required secrets: %s", ', '.join(missing))
             sys.exit(1)
             
         return required_secrets
         
     def load_from_env_vars(self) -> Dict[str, str]:
         """Load from environment variables (least secure)."""
-        return {
-            'GITHUB_TOKEN': os.environ.get('GITHUB_TOKEN', ''),
-            'ANTHROPIC_API_KEY': os.environ.get('ANTHROPIC_API_KEY', ''),
-        }
+        return {name: os.environ.get(name, '') for name in REQUIRED_SECRETS}
         
     def load_from_env_files(self) -> Dict[str, str]:
         """Load from .env files with proper permissions check."""
@@ -84,38 +102,36 @@ class SecretsLoader:
         env_files = ['.env', '.env.local', '.env.production']
         
         for env_file in env_files:
-            env_path = Path(env_file)
-            if env_path.exists():
-                # Check file permissions
-                stat_info = env_path.stat()
-                if stat_info.st_mode & 0o077:
-                    logger.warning(f"⚠️  {env_file} has overly permissive permissions!")
-                    
-                with open(env_path) as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            if key in ['GITHUB_TOKEN', 'ANTHROPIC_API_KEY']:
-                                secrets[key] = value.strip('"\'')
-                                
+            # A single stat both detects missing files and yields the permissions
+            try:
+                stat_info = os.stat(env_file)
+            except FileNotFoundError:
+                continue
+                
+            # Check file permissions
+            if stat_info.st_mode & 0o077:
+                logger.warning("⚠️  %s has overly permissive permissions!", env_file)
+                
+            with open(env_file) as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#') and '=' in line:
+                        key, value = line.split('=', 1)
+                        if key in _REQUIRED_SECRET_SET:
+                            secrets[key] = value.strip('"\'')
+                            
         return secrets
         
     def load_from_docker_secrets(self) -> Dict[str, str]:
         """Load from Docker secrets (recommended for Docker deployments)."""
         secrets = {}
-        secret_mappings = {
-            'github_token': 'GITHUB_TOKEN',
-            'anthropic_api_key': 'ANTHROPIC_API_KEY',
-        }
-        
-        for file_name, env_name in secret_mappings.items():
+        for file_name, env_name in DOCKER_SECRET_FILES.items():
             secret_file = Path(f'/run/secrets/{file_name}')
             if secret_file.exists():
                 secrets[env_name] = secret_file.read_text().strip()
                 
         # Also check _FILE environment variables
-        for env_name in ['GITHUB_TOKEN', 'ANTHROPIC_API_KEY']:
+        for env_name in REQUIRED_SECRETS:
             file_var = f"{env_name}_FILE"
             if file_var in os.environ:
                 secret_file = Path(os.environ[file_var])
@@ -158,7 +174,7 @@ class SecretsLoader:
             logger.debug("boto3 not installed, skipping AWS Secrets Manager")
             return {}
         except Exception as e:
-            logger.debug(f"AWS Secrets Manager error: {e}")
+            logger.debug("AWS Secrets Manager error: %s", e)
             return {}
             
     def load_from_hashicorp_vault(self) -> Dict[str, str]:
@@ -196,7 +212,7 @@ class SecretsLoader:
             logger.debug("hvac not installed, skipping HashiCorp Vault")
             return {}
         except Exception as e:
-            logger.debug(f"Vault error: {e}")
+            logger.debug("Vault error: %s", e)
             return {}
             
     def load_from_azure_keyvault(self) -> Dict[str, str]:
@@ -208,31 +224,36 @@ class SecretsLoader:
             
         try:
             from azure.keyvault.secrets import SecretClient
-            from azure.identity import DefaultAzureCredential
             
             keyvault_uri = f"https://{keyvault_name}.vault.azure.net"
-            credential = DefaultAzureCredential()
+            credential = _get_azure_credential()
             client = SecretClient(vault_url=keyvault_uri, credential=credential)
             
-            secrets = {}
             secret_names = {
                 'github-token': 'GITHUB_TOKEN',
                 'anthropic-api-key': 'ANTHROPIC_API_KEY',
             }
             
-            for secret_name, env_name in secret_names.items():
+            def fetch_secret(secret_name):
                 try:
-                    secret = client.get_secret(secret_name)
-                    secrets[env_name] = secret.value
+                    return client.get_secret(secret_name).value
                 except Exception:
-                    continue
+                    return None
                     
-            return secrets
+            # Each lookup is an independent HTTPS round trip, so issue them together
+            with ThreadPoolExecutor(max_workers=len(secret_names)) as executor:
+                values = list(executor.map(fetch_secret, secret_names))
+                
+            return {
+                env_name: value
+                for env_name, value in zip(secret_names.values(), values)
+                if value is not None
+            }
         except ImportError:
             logger.debug("azure-keyvault not installed, skipping Azure Key Vault")
             return {}
         except Exception as e:
-            logger.debug(f"Azure Key Vault error: {e}")
+            logger.debug("Azure Key Vault error: %s", e)
             return {}
             
     def load_from_1password(self) -> Dict[str, str]:
@@ -241,50 +262,64 @@ class SecretsLoader:
             return {}
             
         try:
-            # Check if signed in
-            result = subprocess.run(['op', 'whoami'], capture_output=True, text=True)
-            if result.returncode != 0:
-                return {}
-                
             secrets = {}
             item_refs = {
                 'op://Private/Claude Bot/github_token': 'GITHUB_TOKEN',
                 'op://Private/Claude Bot/anthropic_api_key': 'ANTHROPIC_API_KEY',
             }
             
+            # No separate `op whoami` probe: the first read fails fast when signed out
             for ref, env_name in item_refs.items():
-                try:
-                    result = subprocess.run(
-                        ['op', 'read', ref],
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
+                result = subprocess.run(
+                    ['op', 'read', ref],
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    text=True
+                )
+                if result.returncode == 0:
                     secrets[env_name] = result.stdout.strip()
-                except subprocess.CalledProcessError:
-                    continue
+                elif 'signed in' in result.stderr:
+                    logger.debug("1Password CLI is not signed in, skipping")
+                    break
                     
             return secrets
         except Exception as e:
-            logger.debug(f"1Password error: {e}")
+            logger.debug("1Password error: %s", e)
             return {}
             
     def export_to_env(self, secrets: Dict[str, str]) -> None:
         """Export secrets as environment variables."""
-        for key, value in secrets.items():
-            os.environ[key] = value
+        os.environ.update(secrets)
             
     def write_env_file(self, secrets: Dict[str, str], path: str = '.env.secrets') -> None:
         """Write secrets to a secure env file."""
+        content = "# Auto-generated secrets file - DO NOT COMMIT\n" + ''.join(
+            f"{key}={value}\n" for key, value in secrets.items()
+        )
+        
+        # Leave an up-to-date, already locked-down file alone
+        try:
+            if os.stat(path).st_mode & 0o777 == 0o600:
+                with open(path) as f:
+                    if f.read() == content:
+                        logger.info("✓ Secrets in %s are already up to date", path)
+                        return
+        except OSError:
+            pass
+            
+        # mkstemp creates the file as 0600; os.replace swaps it in atomically so
+        # readers never see a partially written or briefly world-readable file
         env_path = Path(path)
-        with open(env_path, 'w') as f:
-            f.write("# Auto-generated secrets file - DO NOT COMMIT\n")
-            for key, value in secrets.items():
-                f.write(f"{key}={value}\n")
-                
-        # Set secure permissions
-        env_path.chmod(0o600)
-        logger.info(f"✓ Wrote secrets to {path} with secure permissions")
+        fd, tmp_path = tempfile.mkstemp(dir=env_path.parent, prefix=f".{env_path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(content)
+            os.replace(tmp_path, env_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+            
+        logger.info("✓ Wrote secrets to %s with secure permissions", path)
 
 
 def main():
@@ -8,6 +8,8 @@ import subprocess
 import argparse
 import json
 
+from git_remote import read_origin_url
+
 class LabelSetup:
     def __init__(self, repo=None):
         self.repo = repo or self.get_repo_from_git()
@@ -44,17 +46,20 @@ class LabelSetup:
     def get_repo_from_git(self):
         """Get repository name from git remote"""
         try:
-            result = subprocess.run(
-                ["git", "config", "--get", "remote.origin.url"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
+            url = read_origin_url(".")
+            if url is None:
+                result = subprocess.run(
+                    ["git", "config", "--get", "remote.origin.url"],
+                    capture_output=True,
+                    text=True
+                )
+                if result.returncode != 0:
+                    return None
                 url = result.stdout.strip()
-                if "github.com" in url:
-                    parts = url.split("/")[-2:]
-                    repo_name = parts[1].replace(".git", "")
-                    return f"{parts[0]}/{repo_name}"
+            if "github.com" in url:
+                parts = url.split("/")[-2:]
+                repo_name = parts[1].replace(".git", "")
+                return f"{parts[0]}/{repo_name}"
             return None
         except Exception as e:
             print(f"Error getting repo: {e}")
@@ -8,6 +8,7 @@ import json
 import os
 import sys
 import subprocess
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 import requests
@@ -19,6 +20,7 @@ class StatusReporter:
         self.data_dir = Path(data_dir)
         self.status_web_url = status_web_url or "http://claude-status-web:5000"
         self.start_time = datetime.now()
+        self._data_dir_ready = False
         
     def collect_bot_status(self):
         """Collect current bot status information"""
@@ -49,12 +51,14 @@ class StatusReporter:
             print(f"Warning: Could not collect environment info: {e}")
         
         # Check queue status
+        task_files = None
         try:
             queue_dir = self.data_dir / "queue"
             processed_dir = self.data_dir / "processed"
             
             queued_tasks = list(queue_dir.glob("*.json")) if queue_dir.exists() else []
             processed_tasks = list(processed_dir.glob("*.json")) if processed_dir.exists() else []
+            task_files = queued_tasks + processed_tasks
             
             status_data.update({
                 "queued_tasks": len(queued_tasks),
@@ -71,9 +75,9 @@ class StatusReporter:
             status_data["status"] = "error"
             status_data["error"] = str(e)
         
-        # Check container health
+        # Check container health, reusing the task files listed above when available
         try:
-            status_data["health"] = self._check_health()
+            status_data["health"] = self._check_health(task_files)
         except Exception as e:
             print(f"Warning: Could not check health: {e}")
             status_data["health"] = "unknown"
@@ -141,7 +145,7 @@ class StatusReporter:
         
         return activities
     
-    def _check_health(self):
+    def _check_health(self, task_files=None):
         """Check bot health status"""
         try:
             # Check if bot data directory is accessible
@@ -149,18 +153,14 @@ class StatusReporter:
                 return "unhealthy"
             
             # Check if bot has been active recently (within last hour)
-            queue_dir = self.data_dir / "queue"
-            processed_dir = self.data_dir / "processed"
+            if task_files is None:
+                task_files = []
+                for directory in [self.data_dir / "queue", self.data_dir / "processed"]:
+                    if directory.exists():
+                        task_files.extend(directory.glob("*.json"))
             
-            recent_activity = False
-            one_hour_ago = datetime.now() - timedelta(hours=1)
-            
-            for directory in [queue_dir, processed_dir]:
-                if directory.exists():
-                    for file_path in directory.glob("*.json"):
-                        if datetime.fromtimestamp(file_path.stat().st_mtime) > one_hour_ago:
-                            recent_activity = True
-                            break
+            one_hour_ago = (datetime.now() - timedelta(hours=1)).timestamp()
+            recent_activity = any(file_path.stat().st_mtime > one_hour_ago for file_path in task_files)
             
             return "healthy" if recent_activity else "idle"
             
@@ -171,10 +171,22 @@ class StatusReporter:
         """Save status to local file"""
         try:
             status_file = self.data_dir / "status.json"
-            status_file.parent.mkdir(parents=True, exist_ok=True)
+            if not self._data_dir_ready:
+                status_file.parent.mkdir(parents=True, exist_ok=True)
+                self._data_dir_ready = True
             
-            with open(status_file, 'w') as f:
-                json.dump(status_data, f, indent=2)
+            # A unique temp file per write keeps concurrent reporters from sharing
+            # one; os.replace swaps it in so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.data_dir, prefix=".status.", suffix=".tmp")
+            try:
+                # mkstemp creates 0600; keep status.json readable like before
+                os.fchmod(fd, 0o644)
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(status_data, f, indent=2)
+                os.replace(tmp_path, status_file)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
             
             print(f"✅ Status saved locally to {status_file}")
             return True
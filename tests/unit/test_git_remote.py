@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Git Remote Helpers
+Tests reading the origin URL from .git/config and the git fallback
+"""
+
+import pytest
+import sys
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from scripts.git_remote import read_origin_url
+from scripts.github_task_executor import GitHubTaskExecutor
+
+
+class TestReadOriginUrl:
+    """Test read_origin_url"""
+
+    def setup_method(self):
+        """Set up each test method"""
+        self.test_workspace = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        """Clean up after each test"""
+        if self.test_workspace.exists():
+            shutil.rmtree(self.test_workspace)
+
+    def write_git_config(self, content, encoding="utf-8"):
+        """Write a .git/config into the test workspace"""
+        git_dir = self.test_workspace / ".git"
+        git_dir.mkdir()
+        (git_dir / "config").write_bytes(content.encode(encoding))
+
+    def test_reads_plain_origin_url(self):
+        """Test the origin URL is read from a plain checkout"""
+        self.write_git_config(
+            '[core]\n\tbare = false\n'
+            '[remote "origin"]\n\turl = https://github.com/acme/widgets.git\n'
+            '\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+        )
+
+        assert read_origin_url(self.test_workspace) == "https://github.com/acme/widgets.git"
+
+    def test_quoted_or_commented_value_is_left_to_git(self):
+        """Test values git would unquote or strip comments from are not returned raw"""
+        self.write_git_config('[remote "origin"]\n\turl = "https://github.com/q/r.git" ; comment\n')
+
+        assert read_origin_url(self.test_workspace) is None
+
+    def test_missing_git_dir_returns_none(self):
+        """Test a workspace without .git yields None"""
+        assert read_origin_url(self.test_workspace) is None
+
+    def test_worktree_git_file_returns_none(self):
+        """Test a worktree, where .git is a file, yields None"""
+        (self.test_workspace / ".git").write_text("gitdir: /elsewhere/.git/worktrees/wt\n")
+
+        assert read_origin_url(self.test_workspace) is None
+
+    def test_non_utf8_config_returns_none(self):
+        """Test an undecodable config yields None instead of raising"""
+        self.write_git_config('[user]\n\tname = Jos\xe9\n', encoding="latin-1")
+
+        assert read_origin_url(self.test_workspace) is None
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_executor_falls_back_to_git(self):
+        """Test get_repo_from_git asks git when the config cannot be read directly"""
+        subprocess.run(["git", "init", "-q", str(self.test_workspace)], check=True)
+        with open(self.test_workspace / ".git" / "config", "a") as f:
+            f.write('[remote "origin"]\n\turl = "https://github.com/q/r.git" ; comment\n')
+
+        executor = GitHubTaskExecutor(
+            workspace_dir=str(self.test_workspace),
+            data_dir=str(self.test_workspace / "data")
+        )
+
+        assert executor.repo == "q/r"
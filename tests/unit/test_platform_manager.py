@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Platform Manager
+Tests platform detection from project structure
+"""
+
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from scripts.platform_manager import PlatformManager
+
+
+class TestPlatformDetection:
+    """Test PlatformManager.detect_platforms"""
+
+    def setup_method(self):
+        """Set up each test method"""
+        self.test_workspace = Path(tempfile.mkdtemp())
+        self.manager = PlatformManager(str(project_root / "config" / "platforms.yml"))
+
+    def teardown_method(self):
+        """Clean up after each test"""
+        if self.test_workspace.exists():
+            shutil.rmtree(self.test_workspace)
+
+    def test_empty_workspace_detects_nothing(self):
+        """Test that an empty workspace yields no platforms"""
+        assert self.manager.detect_platforms(str(self.test_workspace)) == {}
+
+    def test_detects_nodejs_engine_version(self):
+        """Test Node.js version is read from package.json engines"""
+        (self.test_workspace / "package.json").write_text(
+            json.dumps({"engines": {"node": ">=18.16.0"}})
+        )
+
+        detected = self.manager.detect_platforms(str(self.test_workspace))
+
+        assert detected == {"nodejs": "18.16.0"}
+
+    def test_nvmrc_version_takes_precedence(self):
+        """Test Node.js version is read from .nvmrc before package.json"""
+        (self.test_workspace / ".nvmrc").write_text("20.10.0\n")
+        (self.test_workspace / "package.json").write_text(
+            json.dumps({"engines": {"node": ">=18.16.0"}})
+        )
+
+        detected = self.manager.detect_platforms(str(self.test_workspace))
+
+        assert detected == {"nodejs": "20.10.0"}
+
+    def test_detects_multiple_platforms_by_extension(self):
+        """Test detection of platforms identified only by file extension"""
+        (self.test_workspace / "App.csproj").write_text(
+            "<Project><PropertyGroup><TargetFramework>net8.0</TargetFramework></PropertyGroup></Project>"
+        )
+        (self.test_workspace / "main.go").write_text("package main\n")
+
+        detected = self.manager.detect_platforms(str(self.test_workspace))
+
+        assert detected["dotnet"] == "8.0"
+        assert "golang" in detected
+        assert "nodejs" not in detected
+
+    def test_dangling_symlink_is_not_detected(self):
+        """Test a broken symlink does not count as a present project file"""
+        (self.test_workspace / "go.mod").symlink_to(self.test_workspace / "missing")
+
+        assert self.manager.detect_platforms(str(self.test_workspace)) == {}
+
+    def test_detector_works_without_snapshot(self):
+        """Test detectors fall back to filesystem checks when called directly"""
+        (self.test_workspace / "go.mod").write_text("module example\n\ngo 1.21\n")
+
+        assert self.manager._detect_go(self.test_workspace) == "1.21"